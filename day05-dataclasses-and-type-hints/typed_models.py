@@ -12,28 +12,30 @@ Run mypy validation:
     mypy typed_models.py
 """
 
+import time
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
-from enum import Enum
+from enum import IntEnum
 
 
 # ============================================================================
 # 1. Transaction Type Enum
 # ============================================================================
 
-class TransactionType(Enum):
-    """Enum for transaction types."""
-    DEPOSIT = "deposit"
-    WITHDRAWAL = "withdrawal"
-    TRANSFER = "transfer"
+class TransactionType(IntEnum):
+    """Enum for transaction types (int-valued, compares as a plain int)."""
+    DEPOSIT = 1
+    WITHDRAWAL = 2
+    TRANSFER = 3
 
 
 # ============================================================================
 # 2. Transaction Dataclass
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     """
     Represents a bank transaction.
@@ -42,12 +44,13 @@ class Transaction:
         id: Unique transaction identifier
         amount: Transaction amount (positive value)
         type: Type of transaction (deposit, withdrawal, transfer)
-        timestamp: When the transaction occurred (auto-generated)
+        timestamp: When the transaction occurred, as epoch nanoseconds
+            (auto-generated)
     """
     id: str
     amount: float
     type: TransactionType
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: int = field(default_factory=time.time_ns)
     description: Optional[str] = None
 
     def __post_init__(self) -> None:
@@ -60,7 +63,24 @@ class Transaction:
 # 3. BankAccount Dataclass
 # ============================================================================
 
-@dataclass
+class _ReadOnlyList(Sequence[Transaction]):
+    """Read-only view over a list of transactions (no copy is made)."""
+    __slots__ = ("_items",)
+
+    def __init__(self, items: list[Transaction]) -> None:
+        self._items = items
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Transaction]:
+        return iter(self._items)
+
+
+@dataclass(slots=True, eq=False)
 class BankAccount:
     """
     Represents a bank account with transaction history.
@@ -77,6 +97,15 @@ class BankAccount:
     transactions: list[Transaction] = field(default_factory=list)
     is_active: bool = True
     created_at: datetime = field(default_factory=datetime.now)
+    _manager: Optional["AccountManager"] = field(
+        default=None, repr=False, compare=False
+    )
+    _transaction_counter: int = field(default=0, repr=False)
+
+    def _generate_transaction_id(self) -> str:
+        """Generate the next sequential transaction ID."""
+        self._transaction_counter += 1
+        return f"TXN-{self._transaction_counter:04d}"
 
     def deposit(self, amount: float, description: Optional[str] = None) -> Transaction:
         """
@@ -98,8 +127,10 @@ class BankAccount:
             raise ValueError("Deposit amount must be positive")
         
         self.balance += amount
+        if self._manager is not None:
+            self._manager._total_balance += amount
         transaction = Transaction(
-            id=f"TXN-{len(self.transactions) + 1:04d}",
+            id=self._generate_transaction_id(),
             amount=amount,
             type=TransactionType.DEPOSIT,
             description=description
@@ -129,8 +160,10 @@ class BankAccount:
             raise ValueError("Insufficient funds")
         
         self.balance -= amount
+        if self._manager is not None:
+            self._manager._total_balance -= amount
         transaction = Transaction(
-            id=f"TXN-{len(self.transactions) + 1:04d}",
+            id=self._generate_transaction_id(),
             amount=amount,
             type=TransactionType.WITHDRAWAL,
             description=description
@@ -138,23 +171,51 @@ class BankAccount:
         self.transactions.append(transaction)
         return transaction
 
-    def get_transaction_history(self) -> list[Transaction]:
-        """Return a copy of the transaction history."""
-        return self.transactions.copy()
+    def set_active(self, active: bool) -> None:
+        """
+        Activate or deactivate the account.
+        
+        Keeps the owning manager's cached total in sync, since only
+        active accounts count towards it.
+        
+        Args:
+            active: New activation state
+        """
+        if active == self.is_active:
+            return
+        self.is_active = active
+        if self._manager is not None:
+            if active:
+                self._manager._total_balance += self.balance
+            else:
+                self._manager._total_balance -= self.balance
+
+    def get_transaction_history(self) -> Sequence[Transaction]:
+        """Return a read-only view of the transaction history."""
+        return _ReadOnlyList(self.transactions)
+
+    def get_recent(self, n: int) -> list[Transaction]:
+        """Return the last n transactions, oldest first."""
+        if n <= 0:
+            return []
+        return self.transactions[-n:]
 
 
 # ============================================================================
 # 4. AccountManager with Typed Methods
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class AccountManager:
     """
     Manages multiple bank accounts.
     
     Provides methods for creating accounts and transferring funds.
+    The total balance of active accounts is kept as a running aggregate
+    updated by each account, so reading it is O(1).
     """
     accounts: dict[str, BankAccount] = field(default_factory=dict)
+    _total_balance: float = field(default=0.0, repr=False)
     
     def create_account(self, owner: str, initial_deposit: float = 0.0) -> BankAccount:
         """
@@ -171,12 +232,14 @@ class AccountManager:
         account = BankAccount(
             account_id=account_id,
             owner=owner,
-            balance=initial_deposit
+            balance=initial_deposit,
+            _manager=self
         )
+        self._total_balance += initial_deposit
         
         if initial_deposit > 0:
             account.transactions.append(Transaction(
-                id=f"TXN-0001",
+                id=account._generate_transaction_id(),
                 amount=initial_deposit,
                 type=TransactionType.DEPOSIT,
                 description="Initial deposit"
@@ -237,11 +300,24 @@ class AccountManager:
         return withdrawal, deposit
 
     def get_total_balance(self) -> float:
-        """Calculate total balance across all active accounts."""
-        return sum(
-            acc.balance for acc in self.accounts.values() 
+        """Return total balance across all active accounts."""
+        return self._total_balance
+
+    def recalculate_total_balance(self) -> float:
+        """
+        Rebuild the cached total from the accounts themselves.
+        
+        Only needed if an account was changed without going through
+        deposit/withdraw/set_active (e.g. assigning is_active directly).
+        
+        Returns:
+            The recalculated total balance
+        """
+        self._total_balance = sum(
+            acc.balance for acc in self.accounts.values()
             if acc.is_active
         )
+        return self._total_balance
 
 
 # ============================================================================
@@ -279,7 +355,7 @@ def main() -> None:
     # Show transaction history
     print(f"\nAlice's transactions:")
     for txn in alice_account.get_transaction_history():
-        print(f"  {txn.id}: {txn.type.value} ${txn.amount:.2f} - {txn.description or 'N/A'}")
+        print(f"  {txn.id}: {txn.type.name.lower()} ${txn.amount:.2f} - {txn.description or 'N/A'}")
 
 
 if __name__ == "__main__":
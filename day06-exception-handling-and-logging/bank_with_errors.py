@@ -13,11 +13,15 @@ Run this file to see logging in action:
 Check bank.log for file output.
 """
 
+import atexit
 import logging
+import queue
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
-from enum import Enum
+from enum import IntEnum
+from logging.handlers import QueueHandler, QueueListener
 
 
 # ============================================================================
@@ -52,8 +56,15 @@ def setup_logging() -> logging.Logger:
     )
     file_handler.setFormatter(file_format)
     
+    # File writes happen on a background thread; callers only enqueue
+    log_queue: queue.Queue = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    
     logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    logger.addHandler(queue_handler)
     
     return logger
 
@@ -114,24 +125,24 @@ class AccountInactiveError(BankError):
 # 3. Transaction Type Enum
 # ============================================================================
 
-class TransactionType(Enum):
-    DEPOSIT = "DEPOSIT"
-    WITHDRAWAL = "WITHDRAWAL"
-    TRANSFER = "TRANSFER"
+class TransactionType(IntEnum):
+    DEPOSIT = 1
+    WITHDRAWAL = 2
+    TRANSFER = 3
 
 
 # ============================================================================
 # 4. Transaction Dataclass
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     """Represents a bank transaction."""
     id: str
     type: TransactionType
     amount: float
     balance_after: float
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: int = field(default_factory=time.time_ns)  # epoch nanoseconds
     description: Optional[str] = None
     success: bool = True
 
@@ -140,7 +151,7 @@ class Transaction:
 # 5. BankAccount with Exception Handling
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class BankAccount:
     """Bank account with proper exception handling and logging."""
     account_id: str
@@ -151,11 +162,26 @@ class BankAccount:
     created_at: datetime = field(default_factory=datetime.now)
     
     _transaction_counter: int = field(default=0, repr=False)
+    _id_prefix: str = field(init=False, repr=False)
+    _txn_by_id: dict[str, Transaction] = field(default_factory=dict, repr=False)
+    _txn_by_type: dict[TransactionType, list[Transaction]] = field(
+        default_factory=lambda: {t: [] for t in TransactionType}, repr=False
+    )
+    
+    def __post_init__(self) -> None:
+        """Cache the per-account prefix used for transaction IDs."""
+        self._id_prefix = f"{self.account_id}-TXN-"
     
     def _generate_transaction_id(self) -> str:
         """Generate unique transaction ID."""
         self._transaction_counter += 1
-        return f"{self.account_id}-TXN-{self._transaction_counter:04d}"
+        return f"{self._id_prefix}{self._transaction_counter:04d}"
+    
+    def _append_txn(self, txn: Transaction) -> None:
+        """Record a transaction in the history and its lookup indexes."""
+        self.transactions.append(txn)
+        self._txn_by_id[txn.id] = txn
+        self._txn_by_type[txn.type].append(txn)
     
     def _validate_active(self) -> None:
         """Check if account is active."""
@@ -167,13 +193,20 @@ class BankAccount:
         if amount <= 0:
             raise NegativeAmountError(amount, operation)
     
-    def deposit(self, amount: float, description: Optional[str] = None) -> Transaction:
+    def deposit(
+        self,
+        amount: float,
+        description: Optional[str] = None,
+        _silent: bool = False
+    ) -> Transaction:
         """
         Deposit money into the account.
         
         Args:
             amount: Amount to deposit (must be positive)
             description: Optional transaction description
+            _silent: Skip logging; used by AccountManager.transfer,
+                which logs the whole operation itself
             
         Returns:
             Transaction record
@@ -182,11 +215,15 @@ class BankAccount:
             AccountInactiveError: If account is inactive
             NegativeAmountError: If amount is not positive
         """
-        logger.debug(f"Deposit attempt: account={self.account_id}, amount=${amount:.2f}")
+        if not _silent:
+            logger.debug("Deposit attempt: account=%s, amount=$%.2f", self.account_id, amount)
         
         try:
-            self._validate_active()
-            self._validate_amount(amount, "deposit")
+            # Inlined _validate_active/_validate_amount (hot path)
+            if not self.is_active:
+                raise AccountInactiveError(self.account_id)
+            if amount <= 0:
+                raise NegativeAmountError(amount, "deposit")
             
             self.balance += amount
             
@@ -197,25 +234,34 @@ class BankAccount:
                 balance_after=self.balance,
                 description=description
             )
-            self.transactions.append(transaction)
+            self._append_txn(transaction)
             
-            logger.info(
-                f"Deposit successful: account={self.account_id}, "
-                f"amount=${amount:.2f}, new_balance=${self.balance:.2f}"
-            )
+            if not _silent:
+                logger.info(
+                    "Deposit successful: account=%s, amount=$%.2f, new_balance=$%.2f",
+                    self.account_id, amount, self.balance
+                )
             return transaction
             
         except BankError as e:
-            logger.error(f"Deposit failed: {e}")
+            if not _silent:
+                logger.error("Deposit failed: %s", e)
             raise
     
-    def withdraw(self, amount: float, description: Optional[str] = None) -> Transaction:
+    def withdraw(
+        self,
+        amount: float,
+        description: Optional[str] = None,
+        _silent: bool = False
+    ) -> Transaction:
         """
         Withdraw money from the account.
         
         Args:
             amount: Amount to withdraw (must be positive and <= balance)
             description: Optional transaction description
+            _silent: Skip logging; used by AccountManager.transfer,
+                which logs the whole operation itself
             
         Returns:
             Transaction record
@@ -225,14 +271,18 @@ class BankAccount:
             NegativeAmountError: If amount is not positive
             InsufficientFundsError: If balance is too low
         """
-        logger.debug(
-            f"Withdrawal attempt: account={self.account_id}, "
-            f"amount=${amount:.2f}, balance=${self.balance:.2f}"
-        )
+        if not _silent:
+            logger.debug(
+                "Withdrawal attempt: account=%s, amount=$%.2f, balance=$%.2f",
+                self.account_id, amount, self.balance
+            )
         
         try:
-            self._validate_active()
-            self._validate_amount(amount, "withdrawal")
+            # Inlined _validate_active/_validate_amount (hot path)
+            if not self.is_active:
+                raise AccountInactiveError(self.account_id)
+            if amount <= 0:
+                raise NegativeAmountError(amount, "withdrawal")
             
             if amount > self.balance:
                 raise InsufficientFundsError(self.balance, amount)
@@ -246,16 +296,18 @@ class BankAccount:
                 balance_after=self.balance,
                 description=description
             )
-            self.transactions.append(transaction)
+            self._append_txn(transaction)
             
-            logger.info(
-                f"Withdrawal successful: account={self.account_id}, "
-                f"amount=${amount:.2f}, new_balance=${self.balance:.2f}"
-            )
+            if not _silent:
+                logger.info(
+                    "Withdrawal successful: account=%s, amount=$%.2f, new_balance=$%.2f",
+                    self.account_id, amount, self.balance
+                )
             return transaction
             
         except BankError as e:
-            logger.error(f"Withdrawal failed: {e}")
+            if not _silent:
+                logger.error("Withdrawal failed: %s", e)
             raise
     
     def get_statement(self) -> str:
@@ -271,27 +323,48 @@ class BankAccount:
         
         for txn in self.transactions[-10:]:  # Last 10 transactions
             lines.append(
-                f"  {txn.timestamp:%Y-%m-%d %H:%M} | {txn.type.value:10} | "
+                f"  {datetime.fromtimestamp(txn.timestamp / 1e9):%Y-%m-%d %H:%M} | "
+                f"{txn.type.name:10} | "
                 f"${txn.amount:>10.2f} | Balance: ${txn.balance_after:>10.2f}"
             )
         
         return "\n".join(lines)
+    
+    def get_by_id(self, txn_id: str) -> Optional[Transaction]:
+        """Look up a transaction by ID, or None if it doesn't exist."""
+        return self._txn_by_id.get(txn_id)
+    
+    def filter_by_type(self, txn_type: TransactionType) -> list[Transaction]:
+        """Return all transactions of the given type, oldest first."""
+        return self._txn_by_type[txn_type].copy()
 
 
 # ============================================================================
 # 6. AccountManager with Exception Handling
 # ============================================================================
 
-@dataclass
+# Pre-formatted IDs for the first 10,000 accounts (saves formatting on bulk creates)
+_ACCOUNT_IDS = [f"ACC-{i:06d}" for i in range(10_000)]
+
+
+@dataclass(slots=True, eq=False)
 class AccountManager:
-    """Manages multiple accounts with proper exception handling."""
-    accounts: dict[str, BankAccount] = field(default_factory=dict)
+    """
+    Manages multiple accounts with proper exception handling.
+    
+    Accounts are kept in creation order in accounts_list for iteration,
+    with _id_to_idx mapping each account ID to its list position.
+    """
+    accounts_list: list[BankAccount] = field(default_factory=list)
     
     _account_counter: int = field(default=0, repr=False)
+    _id_to_idx: dict[str, int] = field(default_factory=dict, repr=False)
     
     def _generate_account_id(self) -> str:
         """Generate unique account ID."""
         self._account_counter += 1
+        if self._account_counter < len(_ACCOUNT_IDS):
+            return _ACCOUNT_IDS[self._account_counter]
         return f"ACC-{self._account_counter:06d}"
     
     def create_account(
@@ -312,7 +385,7 @@ class AccountManager:
         Raises:
             NegativeAmountError: If initial deposit is negative
         """
-        logger.info(f"Creating account for: {owner}")
+        logger.info("Creating account for: %s", owner)
         
         try:
             if initial_deposit < 0:
@@ -326,7 +399,7 @@ class AccountManager:
             )
             
             if initial_deposit > 0:
-                account.transactions.append(Transaction(
+                account._append_txn(Transaction(
                     id=f"{account_id}-TXN-0000",
                     type=TransactionType.DEPOSIT,
                     amount=initial_deposit,
@@ -334,16 +407,17 @@ class AccountManager:
                     description="Initial deposit"
                 ))
             
-            self.accounts[account_id] = account
+            self._id_to_idx[account_id] = len(self.accounts_list)
+            self.accounts_list.append(account)
             
             logger.info(
-                f"Account created: id={account_id}, owner={owner}, "
-                f"initial_balance=${initial_deposit:.2f}"
+                "Account created: id=%s, owner=%s, initial_balance=$%.2f",
+                account_id, owner, initial_deposit
             )
             return account
             
         except BankError as e:
-            logger.error(f"Account creation failed: {e}")
+            logger.error("Account creation failed: %s", e)
             raise
     
     def get_account(self, account_id: str) -> BankAccount:
@@ -353,10 +427,10 @@ class AccountManager:
         Raises:
             AccountNotFoundError: If account doesn't exist
         """
-        account = self.accounts.get(account_id)
-        if account is None:
-            raise AccountNotFoundError(account_id)
-        return account
+        try:
+            return self.accounts_list[self._id_to_idx[account_id]]
+        except KeyError:
+            raise AccountNotFoundError(account_id) from None
     
     def transfer(
         self, 
@@ -382,8 +456,8 @@ class AccountManager:
             InsufficientFundsError: If source has insufficient funds
             NegativeAmountError: If amount is not positive
         """
-        logger.info(
-            f"Transfer attempt: from={from_id}, to={to_id}, amount=${amount:.2f}"
+        logger.debug(
+            "Transfer attempt: from=%s, to=%s, amount=$%.2f", from_id, to_id, amount
         )
         
         try:
@@ -393,22 +467,26 @@ class AccountManager:
             # Perform withdrawal first (may raise InsufficientFundsError)
             withdrawal = from_account.withdraw(
                 amount, 
-                description=f"Transfer to {to_id}" + (f": {description}" if description else "")
+                description=f"Transfer to {to_id}" + (f": {description}" if description else ""),
+                _silent=True
             )
             
             # Then deposit (should always succeed if withdrawal succeeded)
             deposit = to_account.deposit(
                 amount,
-                description=f"Transfer from {from_id}" + (f": {description}" if description else "")
+                description=f"Transfer from {from_id}" + (f": {description}" if description else ""),
+                _silent=True
             )
             
             logger.info(
-                f"Transfer successful: from={from_id}, to={to_id}, amount=${amount:.2f}"
+                "Transfer successful: from=%s, to=%s, amount=$%.2f, "
+                "from_balance=$%.2f, to_balance=$%.2f",
+                from_id, to_id, amount, from_account.balance, to_account.balance
             )
             return withdrawal, deposit
             
         except BankError as e:
-            logger.error(f"Transfer failed: {e}")
+            logger.error("Transfer failed: %s", e)
             raise
 
 
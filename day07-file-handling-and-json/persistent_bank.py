@@ -10,16 +10,58 @@ This file demonstrates:
 Run this file to see persistence in action:
     python persistent_bank.py
 
-Data will be saved to accounts.json.
+Data will be saved to accounts.json, with operations since the last
+snapshot in accounts.ndjson.
 """
 
 import json
 import logging
-from dataclasses import dataclass, field, asdict
+import os
+import time
+from dataclasses import dataclass, field
+from itertools import accumulate
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
 from pathlib import Path
-from enum import Enum
+from enum import IntEnum
+
+try:
+    import orjson  # Optional C-accelerated JSON encoder/decoder
+except ImportError:
+    orjson = None
+
+
+def _encode_default(obj):
+    """
+    default= hook for the JSON encoders.
+    
+    Lets model objects be passed to the encoder as-is. orjson encodes
+    Transaction dataclasses natively; the stdlib encoder calls this for
+    each one as it reaches it, so no full list of dicts is built first.
+    """
+    if isinstance(obj, Transaction):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(data, pretty: bool = False) -> bytes:
+    """Encode data as UTF-8 JSON: compact by default, indented if pretty."""
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=_encode_default,
+            option=orjson.OPT_INDENT_2 if pretty else None
+        )
+    if pretty:
+        return json.dumps(data, indent=2, default=_encode_default).encode('utf-8')
+    return json.dumps(
+        data, separators=(",", ":"), default=_encode_default
+    ).encode('utf-8')
+
+
+def _json_loads(raw: bytes):
+    """Decode JSON from bytes with the fastest available parser."""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 
 # ============================================================================
@@ -67,46 +109,102 @@ class AccountNotFoundError(BankError):
 # 3. Transaction Type Enum
 # ============================================================================
 
-class TransactionType(Enum):
-    DEPOSIT = "DEPOSIT"
-    WITHDRAWAL = "WITHDRAWAL"
+class TransactionType(IntEnum):
+    DEPOSIT = 1
+    WITHDRAWAL = 2
+    
+    @classmethod
+    def _missing_(cls, value):
+        """Accept member names, as stored by files saved before IntEnum."""
+        if isinstance(value, str):
+            return cls.__members__.get(value)
+        return None
+
+
+_TXN_TYPE_BY_VALUE = TransactionType._value2member_map_
+
+
+def _txn_type(value) -> TransactionType:
+    """Look up a stored type directly, skipping Enum.__call__ for current files."""
+    try:
+        return _TXN_TYPE_BY_VALUE[value]
+    except KeyError:
+        return TransactionType(value)  # Legacy name, or raises ValueError
+
+
+def _timestamp_ns(value) -> int:
+    """Epoch nanoseconds, converting ISO strings from files saved before them."""
+    if isinstance(value, str):
+        dt = datetime.fromisoformat(value)
+        return int(dt.timestamp()) * 1_000_000_000 + dt.microsecond * 1000
+    return value
 
 
 # ============================================================================
 # 4. Transaction Dataclass
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     """Represents a bank transaction."""
     id: str
     type: TransactionType
     amount: float
     balance_after: float
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: int = field(default_factory=time.time_ns)  # epoch nanoseconds
     description: Optional[str] = None
     
+    @property
+    def dt(self) -> datetime:
+        """Timestamp as a local datetime (derived, nothing to parse)."""
+        return datetime.fromtimestamp(self.timestamp / 1e9)
+    
     def to_dict(self) -> dict:
         """Convert to JSON-serializable dict."""
         return {
             "id": self.id,
-            "type": self.type.value,  # Convert enum to string
+            "type": int(self.type),  # Convert enum to int
             "amount": self.amount,
             "balance_after": self.balance_after,
             "timestamp": self.timestamp,
             "description": self.description
         }
     
+    @classmethod
+    def _fast_new(
+        cls,
+        id: str,
+        type: TransactionType,
+        amount: float,
+        balance_after: float,
+        timestamp: int,
+        description: Optional[str]
+    ) -> "Transaction":
+        """
+        Build a Transaction without going through __init__.
+        
+        Only for trusted, already-complete field values (data loaded from
+        disk or computed by replay), so no defaults need to be filled in.
+        """
+        txn = object.__new__(cls)
+        txn.id = id
+        txn.type = type
+        txn.amount = amount
+        txn.balance_after = balance_after
+        txn.timestamp = timestamp
+        txn.description = description
+        return txn
+    
     @classmethod
     def from_dict(cls, data: dict) -> "Transaction":
         """Create Transaction from dict."""
-        return cls(
-            id=data["id"],
-            type=TransactionType(data["type"]),
-            amount=data["amount"],
-            balance_after=data["balance_after"],
-            timestamp=data["timestamp"],
-            description=data.get("description")
+        return cls._fast_new(
+            data["id"],
+            _txn_type(data["type"]),
+            data["amount"],
+            data["balance_after"],
+            _timestamp_ns(data["timestamp"]),
+            data.get("description")
         )
 
 
@@ -114,7 +212,7 @@ class Transaction:
 # 5. BankAccount Dataclass with JSON Persistence
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class BankAccount:
     """Bank account with JSON persistence."""
     account_id: str
@@ -124,10 +222,17 @@ class BankAccount:
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
     
     _transaction_counter: int = field(default=0, repr=False)
+    _id_prefix: str = field(init=False, repr=False)
+    # Encoded JSON of this account for snapshots; None once it changes
+    _cached_bytes: Optional[bytes] = field(default=None, init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        """Cache the per-account prefix used for transaction IDs."""
+        self._id_prefix = f"{self.account_id}-TXN-"
     
     def _generate_transaction_id(self) -> str:
         self._transaction_counter += 1
-        return f"{self.account_id}-TXN-{self._transaction_counter:04d}"
+        return f"{self._id_prefix}{self._transaction_counter:04d}"
     
     def deposit(self, amount: float, description: Optional[str] = None) -> Transaction:
         """Deposit money into account."""
@@ -135,6 +240,7 @@ class BankAccount:
             raise NegativeAmountError(amount)
         
         self.balance += amount
+        self._cached_bytes = None
         txn = Transaction(
             id=self._generate_transaction_id(),
             type=TransactionType.DEPOSIT,
@@ -154,6 +260,7 @@ class BankAccount:
             raise InsufficientFundsError(self.balance, amount)
         
         self.balance -= amount
+        self._cached_bytes = None
         txn = Transaction(
             id=self._generate_transaction_id(),
             type=TransactionType.WITHDRAWAL,
@@ -165,13 +272,64 @@ class BankAccount:
         logger.info(f"Withdrew ${amount:.2f} from {self.account_id} (balance: ${self.balance:.2f})")
         return txn
     
-    def to_dict(self) -> dict:
-        """Convert to JSON-serializable dict."""
+    def replay(self, records: list[dict]) -> list[Transaction]:
+        """
+        Apply a batch of deposit/withdrawal records in one pass.
+        
+        Each record needs "type" and "amount"; "timestamp" and
+        "description" are optional. Running balances are computed with
+        a single accumulate() instead of calling deposit()/withdraw()
+        per record, and the whole batch is validated before the account
+        is modified, so a bad record leaves it untouched.
+        """
+        types = [_txn_type(r["type"]) for r in records]
+        amounts = [r["amount"] for r in records]
+        for amount in amounts:
+            if amount <= 0:
+                raise NegativeAmountError(amount)
+        
+        deltas = [
+            a if t is TransactionType.DEPOSIT else -a
+            for t, a in zip(types, amounts)
+        ]
+        balances = list(accumulate(deltas, initial=self.balance))
+        for i, balance_after in enumerate(balances[1:]):
+            if balance_after < 0:
+                raise InsufficientFundsError(balances[i], amounts[i])
+        
+        now = time.time_ns()
+        txns = [
+            Transaction._fast_new(
+                self._generate_transaction_id(),
+                t,
+                a,
+                b,
+                _timestamp_ns(r["timestamp"]) if "timestamp" in r else now,
+                r.get("description")
+            )
+            for r, t, a, b in zip(records, types, amounts, balances[1:])
+        ]
+        self.transactions.extend(txns)
+        self.balance = balances[-1]
+        self._cached_bytes = None
+        logger.info(f"Replayed {len(txns)} transactions on {self.account_id} (balance: ${self.balance:.2f})")
+        return txns
+    
+    def to_dict(self, nested: bool = True) -> dict:
+        """
+        Convert to JSON-serializable dict.
+        
+        With nested=False the transactions are left as Transaction
+        objects, for encoders that serialize them via _encode_default.
+        """
         return {
             "account_id": self.account_id,
             "owner": self.owner,
             "balance": self.balance,
-            "transactions": [t.to_dict() for t in self.transactions],
+            "transactions": (
+                [t.to_dict() for t in self.transactions] if nested
+                else self.transactions
+            ),
             "created_at": self.created_at,
             "_transaction_counter": self._transaction_counter
         }
@@ -186,29 +344,149 @@ class BankAccount:
             transactions=[Transaction.from_dict(t) for t in data["transactions"]],
             created_at=data["created_at"]
         )
-        account._transaction_counter = data.get("_transaction_counter", len(account.transactions))
+        account._transaction_counter = (
+            data["_transaction_counter"] if "_transaction_counter" in data
+            else len(account.transactions)
+        )
         return account
 
 
 # ============================================================================
-# 6. AccountManager with JSON File Persistence
+# 6. Append-Only Transaction Log
 # ============================================================================
 
-@dataclass
+class TransactionLog:
+    """
+    Append-only ledger of account operations, one JSON object per line.
+    
+    Each mutation costs one short append instead of a rewrite of the
+    whole data file. The JSON data file acts as a snapshot, and the log
+    holds every operation made since that snapshot was taken.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self.records = 0  # Records in the log since the last truncate
+        self._fh = None
+        # Set by read(): byte offset just past the last good record, and
+        # whether anything after it (a torn write) needs cutting off
+        self._good_end = 0
+        self._needs_repair = False
+    
+    def append(self, record: dict, sync: bool = True) -> None:
+        """Write one record, flushing it to the OS unless sync is False."""
+        if self._fh is None:
+            self._fh = open(self.path, 'ab')
+        self._fh.write(_json_dumps(record) + b"\n")
+        if sync:
+            self._fh.flush()
+        self.records += 1
+    
+    def read(self) -> Iterator[dict]:
+        """
+        Yield logged records in order.
+        
+        A last line that doesn't parse is a write torn by a crash: it is
+        skipped, and repair() cuts it off before anything is appended.
+        A bad line followed by more records is real corruption and raises
+        ValueError rather than silently dropping the records after it.
+        """
+        self._good_end = 0
+        self._needs_repair = False
+        if not self.path.exists():
+            return
+        with open(self.path, 'rb') as f:
+            for lineno, line in enumerate(f, 1):
+                try:
+                    record = _json_loads(line)
+                except json.JSONDecodeError as e:
+                    if f.read().strip():
+                        raise ValueError(
+                            f"Corrupt record on line {lineno} of {self.path}"
+                        ) from e
+                    logger.warning(f"Ignoring incomplete record at end of {self.path}")
+                    self._needs_repair = True
+                    return
+                self._good_end += len(line)
+                # A complete record missing its newline would swallow the next append
+                self._needs_repair = not line.endswith(b"\n")
+                self.records += 1
+                yield record
+    
+    def repair(self) -> None:
+        """Cut the log back to the last good record found by read()."""
+        if not self._needs_repair:
+            return
+        self.close()
+        with open(self.path, 'r+b') as f:
+            f.truncate(self._good_end)
+            if self._good_end:
+                f.seek(self._good_end - 1)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._needs_repair = False
+    
+    def truncate(self) -> None:
+        """Discard all records (after they were captured in a snapshot)."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+        self.records = 0
+    
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+
+# ============================================================================
+# 7. AccountManager with JSON File Persistence
+# ============================================================================
+
+# Pre-formatted IDs for the first 10,000 accounts (saves formatting on bulk creates)
+_ACCOUNT_IDS = [f"ACC-{i:06d}" for i in range(10_000)]
+
+
+@dataclass(slots=True, eq=False)
 class AccountManager:
-    """Manages accounts with JSON persistence."""
+    """
+    Manages accounts with JSON persistence.
+    
+    Mutations are appended to a TransactionLog next to data_file. The
+    full data file is rewritten as a snapshot by save_to_file(); compact()
+    does this automatically once the log reaches snapshot_every records,
+    and loading replays the log on top of the last snapshot.
+    
+    For bursts of operations, use the manager as a context manager:
+    log writes are buffered and a single snapshot is written on exit.
+    
+        with AccountManager() as manager:
+            manager.deposit(...)
+            manager.withdraw(...)
+    """
     accounts: dict[str, BankAccount] = field(default_factory=dict)
     data_file: Path = field(default=Path("accounts.json"))
+    snapshot_every: int = 100
     
     _account_counter: int = field(default=0, repr=False)
+    _log_seq: int = field(default=0, repr=False)
+    _log: TransactionLog = field(init=False, repr=False)
+    _dirty: bool = field(default=False, init=False, repr=False)
+    _autosave: bool = field(default=True, init=False, repr=False)
+    # Snapshot bytes last written to (or read from) data_file
+    _last_serialized: Optional[bytes] = field(default=None, init=False, repr=False)
     
     def __post_init__(self):
         """Load existing data on initialization."""
-        if self.data_file.exists():
+        self._log = TransactionLog(self.data_file.with_suffix(".ndjson"))
+        if self.data_file.exists() or self._log.path.exists():
             self.load_from_file()
     
     def _generate_account_id(self) -> str:
         self._account_counter += 1
+        if self._account_counter < len(_ACCOUNT_IDS):
+            return _ACCOUNT_IDS[self._account_counter]
         return f"ACC-{self._account_counter:06d}"
     
     def create_account(self, owner: str, initial_deposit: float = 0.0) -> BankAccount:
@@ -233,7 +511,11 @@ class AccountManager:
             ))
         
         self.accounts[account_id] = account
-        self.save_to_file()  # Auto-save
+        self._append_log({
+            "op": "create",
+            "account": account.to_dict(),
+            "_account_counter": self._account_counter
+        })
         
         logger.info(f"Created account {account_id} for {owner}")
         return account
@@ -246,49 +528,144 @@ class AccountManager:
         return account
     
     def deposit(self, account_id: str, amount: float, description: str = None) -> Transaction:
-        """Deposit and save."""
+        """Deposit and log the transaction."""
         account = self.get_account(account_id)
         txn = account.deposit(amount, description)
-        self.save_to_file()
+        self._append_log({"op": "deposit", "account": account_id, "txn": txn.to_dict()})
         return txn
     
     def withdraw(self, account_id: str, amount: float, description: str = None) -> Transaction:
-        """Withdraw and save."""
+        """Withdraw and log the transaction."""
         account = self.get_account(account_id)
         txn = account.withdraw(amount, description)
-        self.save_to_file()
+        self._append_log({"op": "withdraw", "account": account_id, "txn": txn.to_dict()})
         return txn
     
+    def replay(self, account_id: str, records: list[dict]) -> list[Transaction]:
+        """Apply a batch of records to an account and log it as one operation."""
+        account = self.get_account(account_id)
+        txns = account.replay(records)
+        if txns:
+            self._append_log({
+                "op": "replay",
+                "account": account_id,
+                "txns": [txn.to_dict() for txn in txns]
+            })
+        return txns
+    
     # ========================================================================
     # JSON Persistence Methods
     # ========================================================================
     
-    def save_to_file(self) -> None:
-        """Save all accounts to JSON file."""
-        data = {
-            "accounts": {aid: acc.to_dict() for aid, acc in self.accounts.items()},
-            "_account_counter": self._account_counter
+    def _append_log(self, record: dict) -> None:
+        """Append an operation to the log, snapshotting when it gets long."""
+        self._log_seq += 1
+        record["seq"] = self._log_seq
+        self._log.append(record, sync=self._autosave)
+        self._dirty = True
+        if self._autosave and self._log.records >= self.snapshot_every:
+            self.compact()
+    
+    def _apply_log_record(self, record: dict) -> None:
+        """Re-apply one logged operation on top of the loaded snapshot."""
+        if record["op"] == "create":
+            account = BankAccount.from_dict(record["account"])
+            self.accounts[account.account_id] = account
+            self._account_counter = record["_account_counter"]
+        else:
+            account = self.accounts[record["account"]]
+            if record["op"] == "replay":
+                txns = [Transaction.from_dict(t) for t in record["txns"]]
+            else:
+                txns = [Transaction.from_dict(record["txn"])]
+            account.transactions.extend(txns)
+            account.balance = txns[-1].balance_after
+            account._transaction_counter += len(txns)
+            account._cached_bytes = None
+    
+    def _snapshot_data(self) -> dict:
+        return {
+            # Live objects: the encoder walks them without an intermediate copy
+            "accounts": {aid: acc.to_dict(nested=False) for aid, acc in self.accounts.items()},
+            "_account_counter": self._account_counter,
+            "_log_seq": self._log_seq
         }
+    
+    def _encode_snapshot(self) -> bytes:
+        """Compact snapshot bytes, reusing unchanged accounts' cached JSON."""
+        fragments = []
+        for aid, acc in self.accounts.items():
+            if acc._cached_bytes is None:
+                acc._cached_bytes = _json_dumps(acc.to_dict(nested=False))
+            fragments.append(_json_dumps(aid) + b":" + acc._cached_bytes)
+        return (
+            b'{"accounts":{' + b",".join(fragments) + b'}'
+            + b',"_account_counter":' + str(self._account_counter).encode()
+            + b',"_log_seq":' + str(self._log_seq).encode()
+            + b"}"
+        )
+    
+    def save_to_file(self) -> None:
+        """Save a compact snapshot of all accounts and clear the log."""
+        payload = self._encode_snapshot()
         
+        # Temp file + fsync + rename: a crash mid-write leaves the old
+        # snapshot intact, and the log is only cleared once the new one is
+        tmp = self.data_file.with_name(self.data_file.name + ".tmp")
         try:
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            with open(tmp, 'wb') as f:
+                f.write(payload)  # One write call for the whole file
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.data_file)
             logger.debug(f"Saved {len(self.accounts)} accounts to {self.data_file}")
         except IOError as e:
+            tmp.unlink(missing_ok=True)
             logger.error(f"Failed to save data: {e}")
             raise
+        self._last_serialized = payload
+        self._log.truncate()
+        self._dirty = False
+    
+    def compact(self) -> None:
+        """Fold the log into a fresh snapshot so it stops growing."""
+        if self._log.records:
+            logger.debug(f"Compacting {self._log.records} log records into {self.data_file}")
+            self.save_to_file()
+    
+    def flush(self) -> None:
+        """Write a snapshot if anything changed since the last one."""
+        if self._dirty:
+            self.save_to_file()
+    
+    def __enter__(self) -> "AccountManager":
+        """Start a batch: buffer log writes and defer snapshots."""
+        self._autosave = False
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """End the batch with a single snapshot."""
+        self._autosave = True
+        self.flush()
+    
+    def save_pretty(self, path: Path) -> None:
+        """Write an indented copy of the current state for debugging."""
+        path.write_bytes(_json_dumps(self._snapshot_data(), pretty=True))
     
     def load_from_file(self) -> None:
-        """Load accounts from JSON file."""
+        """Load accounts from the JSON snapshot, then replay the log."""
         try:
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.data_file, 'rb') as f:
+                raw = f.read()
+            data = _json_loads(raw)
+            self._last_serialized = raw
             
             self.accounts = {
                 aid: BankAccount.from_dict(acc_data) 
                 for aid, acc_data in data.get("accounts", {}).items()
             }
             self._account_counter = data.get("_account_counter", len(self.accounts))
+            self._log_seq = data.get("_log_seq", 0)
             
             logger.info(f"Loaded {len(self.accounts)} accounts from {self.data_file}")
         except FileNotFoundError:
@@ -296,6 +673,19 @@ class AccountManager:
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in {self.data_file}: {e}")
             raise
+        
+        replayed = 0
+        for record in self._log.read():
+            # Records at or below the snapshot's seq are already in it
+            if record["seq"] <= self._log_seq:
+                continue
+            self._apply_log_record(record)
+            self._log_seq = record["seq"]
+            replayed += 1
+        self._log.repair()  # Never append after a torn line
+        if replayed:
+            self._dirty = True  # Not in the snapshot yet
+            logger.info(f"Replayed {replayed} logged operations from {self._log.path}")
     
     def get_summary(self) -> str:
         """Get summary of all accounts."""
@@ -307,7 +697,7 @@ class AccountManager:
 
 
 # ============================================================================
-# 7. Demo
+# 8. Demo
 # ============================================================================
 
 def demo():
@@ -326,13 +716,15 @@ def demo():
     else:
         print("\n→ No existing data, creating new accounts...")
         
-        # Create accounts
-        alice = manager.create_account("Alice", 1000.0)
-        bob = manager.create_account("Bob", 500.0)
-        
-        # Perform transactions
-        manager.deposit(alice.account_id, 250.0, "Bonus")
-        manager.withdraw(alice.account_id, 100.0, "Groceries")
+        # Batch the writes: one snapshot when the block exits
+        with manager:
+            # Create accounts
+            alice = manager.create_account("Alice", 1000.0)
+            bob = manager.create_account("Bob", 500.0)
+            
+            # Perform transactions
+            manager.deposit(alice.account_id, 250.0, "Bonus")
+            manager.withdraw(alice.account_id, 100.0, "Groceries")
         
         print(manager.get_summary())
     
@@ -342,10 +734,10 @@ def demo():
     print("Run this script again to see data persistence!")
     print("-" * 60)
     
-    # Show file contents
-    if Path("accounts.json").exists():
+    # Show file contents, from the bytes the manager already has in memory
+    if manager._last_serialized is not None:
         print("\nFile contents (first 500 chars):")
-        content = Path("accounts.json").read_text()
+        content = manager._last_serialized.decode("utf-8")
         print(content[:500] + "..." if len(content) > 500 else content)
 
 
@@ -2,6 +2,9 @@
 
 from .models import Task, TaskStatus
 from .manager import TaskManager, TaskNotFoundError
-from .storage import JSONStorage
+from .storage import JSONStorage, MsgpackStorage
 
-__all__ = ["Task", "TaskStatus", "TaskManager", "TaskNotFoundError", "JSONStorage"]
+__all__ = [
+    "Task", "TaskStatus", "TaskManager", "TaskNotFoundError",
+    "JSONStorage", "MsgpackStorage",
+]
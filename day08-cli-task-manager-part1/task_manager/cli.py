@@ -74,6 +74,14 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
+# Pre-rendered table pieces for print_tasks (built once, not per row)
+_STATUS_CELLS = {
+    TaskStatus.COMPLETED: f"{Colors.GREEN}✓ {'Done':<7}{Colors.RESET}",
+    TaskStatus.PENDING: f"{Colors.YELLOW}○ {'Pending':<7}{Colors.RESET}",
+}
+_ROW = ("{:>4}  {}  {:<50}  " + Colors.GRAY + "{}" + Colors.RESET).format
+
+
 def print_tasks(tasks: list, show_header: bool = True) -> None:
     """Print tasks in a formatted table."""
     if not tasks:
@@ -84,15 +92,12 @@ def print_tasks(tasks: list, show_header: bool = True) -> None:
         print(f"\n{Colors.BOLD}{'ID':>4}  {'Status':<10}  {'Title':<50}  {'Created':<12}{Colors.RESET}")
         print("-" * 82)
     
-    for task in tasks:
-        status_color = Colors.GREEN if task.status == TaskStatus.COMPLETED else Colors.YELLOW
-        status_text = "Done" if task.status == TaskStatus.COMPLETED else "Pending"
-        status_icon = "✓" if task.status == TaskStatus.COMPLETED else "○"
-        created = task.created_at[:10]  # Just the date
-        
-        print(f"{task.id:>4}  {status_color}{status_icon} {status_text:<7}{Colors.RESET}  {task.title:<50}  {Colors.GRAY}{created}{Colors.RESET}")
-    
-    print()
+    rows = [
+        _ROW(task.id, _STATUS_CELLS[task.status], task.title, task.created_at[:10])
+        for task in tasks
+    ]
+    # One write for the whole table, plus the trailing blank line
+    sys.stdout.write("\n".join(rows) + "\n\n")
 
 
 def cmd_add(manager: TaskManager, title: str) -> int:
@@ -118,9 +123,7 @@ def cmd_list(manager: TaskManager, status_filter: str) -> int:
     tasks = manager.list(status)
     
     # Summary
-    total = manager.count()
-    pending = manager.count(TaskStatus.PENDING)
-    completed = manager.count(TaskStatus.COMPLETED)
+    total, pending, completed = manager.stats()
     
     print(f"\n{Colors.CYAN}Tasks: {total} total, {pending} pending, {completed} completed{Colors.RESET}")
     
@@ -4,7 +4,8 @@ Task Manager
 Business logic for managing tasks: add, list, complete, delete.
 """
 
-from typing import Optional
+from datetime import datetime
+from typing import Iterable, Optional
 
 from .models import Task, TaskStatus
 from .storage import JSONStorage
@@ -23,6 +24,7 @@ class TaskManager:
     
     Provides CRUD operations:
     - add: Create a new task
+    - add_many: Create several tasks at once
     - list: Get all tasks (with optional filtering)
     - complete: Mark a task as done
     - delete: Remove a task
@@ -32,24 +34,39 @@ class TaskManager:
         """
         Initialize the task manager.
         
+        Tasks are not read from storage until they are first needed.
+        
         Args:
             storage: Storage backend (defaults to JSONStorage)
         """
         self.storage = storage or JSONStorage()
-        self.tasks: list[Task] = []
+        # Keyed by ID for O(1) lookup and delete; dicts keep insertion order
+        self._tasks: dict[int, Task] = {}
         self._next_id: int = 1
-        self._load()
+        self._loaded = False
+    
+    @property
+    def tasks(self) -> list[Task]:
+        """All tasks in creation order, loaded from storage on first access."""
+        self._ensure_loaded()
+        return list(self._tasks.values())
+    
+    def _ensure_loaded(self) -> None:
+        """Load tasks from storage if that hasn't happened yet."""
+        if not self._loaded:
+            self._load()
     
     def _load(self) -> None:
         """Load tasks from storage."""
         data = self.storage.load()
-        self.tasks = [Task.from_dict(t) for t in data.get("tasks", [])]
+        self._tasks = {t["id"]: Task.from_dict(t) for t in data.get("tasks", [])}
         self._next_id = data.get("next_id", 1)
+        self._loaded = True
     
     def _save(self) -> None:
         """Save tasks to storage."""
         data = {
-            "tasks": [t.to_dict() for t in self.tasks],
+            "tasks": [t.to_dict() for t in self._tasks.values()],
             "next_id": self._next_id
         }
         self.storage.save(data)
@@ -64,12 +81,37 @@ class TaskManager:
         Returns:
             The newly created Task
         """
+        self._ensure_loaded()
         task = Task(id=self._next_id, title=title.strip())
         self._next_id += 1
-        self.tasks.append(task)
+        self._tasks[task.id] = task
         self._save()
         return task
     
+    def add_many(self, titles: Iterable[str]) -> list[Task]:
+        """
+        Add several tasks with a single save.
+        
+        Every task in the batch shares one creation timestamp.
+        
+        Args:
+            titles: Task descriptions
+            
+        Returns:
+            The newly created Tasks
+        """
+        self._ensure_loaded()
+        created_at = datetime.now().isoformat()
+        added = []
+        for title in titles:
+            task = Task(id=self._next_id, title=title.strip(), created_at=created_at)
+            self._next_id += 1
+            self._tasks[task.id] = task
+            added.append(task)
+        if added:
+            self._save()
+        return added
+    
     def list(self, status: Optional[TaskStatus] = None) -> list[Task]:
         """
         Get all tasks, optionally filtered by status.
@@ -80,9 +122,10 @@ class TaskManager:
         Returns:
             List of matching tasks
         """
+        self._ensure_loaded()
         if status is None:
-            return self.tasks.copy()
-        return [t for t in self.tasks if t.status == status]
+            return list(self._tasks.values())
+        return [t for t in self._tasks.values() if t.status is status]
     
     def get(self, task_id: int) -> Task:
         """
@@ -97,10 +140,11 @@ class TaskManager:
         Raises:
             TaskNotFoundError: If no task with that ID exists
         """
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        raise TaskNotFoundError(task_id)
+        self._ensure_loaded()
+        try:
+            return self._tasks[task_id]
+        except KeyError:
+            raise TaskNotFoundError(task_id) from None
     
     def complete(self, task_id: int) -> Task:
         """
@@ -116,8 +160,8 @@ class TaskManager:
             TaskNotFoundError: If no task with that ID exists
         """
         task = self.get(task_id)
-        task.complete()
-        self._save()
+        if task.complete():  # Nothing to write if it was already done
+            self._save()
         return task
     
     def delete(self, task_id: int) -> Task:
@@ -134,7 +178,7 @@ class TaskManager:
             TaskNotFoundError: If no task with that ID exists
         """
         task = self.get(task_id)
-        self.tasks.remove(task)
+        del self._tasks[task_id]
         self._save()
         return task
     
@@ -148,4 +192,23 @@ class TaskManager:
         Returns:
             Number of matching tasks
         """
-        return len(self.list(status))
+        self._ensure_loaded()
+        if status is None:
+            return len(self._tasks)
+        return sum(1 for t in self._tasks.values() if t.status is status)
+    
+    def stats(self) -> tuple[int, int, int]:
+        """
+        Count all tasks by status in a single pass.
+        
+        Returns:
+            (total, pending, completed) counts
+        """
+        self._ensure_loaded()
+        pending = completed = 0
+        for task in self._tasks.values():
+            if task.status is TaskStatus.COMPLETED:
+                completed += 1
+            else:
+                pending += 1
+        return len(self._tasks), pending, completed
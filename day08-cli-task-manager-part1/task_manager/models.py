@@ -4,6 +4,7 @@ Task Model
 Defines the Task dataclass with status, serialization, and timestamps.
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -16,7 +17,18 @@ class TaskStatus(Enum):
     COMPLETED = "completed"
 
 
-@dataclass
+_STATUS_BY_VALUE = TaskStatus._value2member_map_
+
+
+def _task_status(value) -> TaskStatus:
+    """Look up a stored status directly, skipping Enum.__call__ for valid data."""
+    try:
+        return _STATUS_BY_VALUE[value]
+    except (KeyError, TypeError):
+        return TaskStatus(value)  # Raises ValueError
+
+
+@dataclass(slots=True)
 class Task:
     """
     Represents a single task.
@@ -36,12 +48,18 @@ class Task:
     )
     completed_at: Optional[str] = None
     
-    def complete(self) -> None:
-        """Mark task as completed."""
-        if self.status == TaskStatus.COMPLETED:
-            return  # Already completed
+    def complete(self) -> bool:
+        """
+        Mark task as completed.
+        
+        Returns:
+            True if the status changed, False if it was already completed
+        """
+        if self.status is TaskStatus.COMPLETED:
+            return False  # Already completed
         self.status = TaskStatus.COMPLETED
         self.completed_at = datetime.now().isoformat()
+        return True
     
     def to_dict(self) -> dict:
         """Convert to JSON-serializable dictionary."""
@@ -59,11 +77,12 @@ class Task:
         return cls(
             id=data["id"],
             title=data["title"],
-            status=TaskStatus(data["status"]),
-            created_at=data["created_at"],
+            status=_task_status(data["status"]),
+            # Interned so tasks created in one batch share a single string
+            created_at=sys.intern(data["created_at"]),
             completed_at=data.get("completed_at")
         )
     
     def __str__(self) -> str:
-        status_icon = "✓" if self.status == TaskStatus.COMPLETED else "○"
+        status_icon = "✓" if self.status is TaskStatus.COMPLETED else "○"
         return f"[{status_icon}] #{self.id}: {self.title}"
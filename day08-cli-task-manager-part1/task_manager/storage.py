@@ -5,9 +5,20 @@ Handles saving and loading data to/from a JSON file.
 """
 
 import json
+import os
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson  # Optional C-accelerated JSON encoder/decoder
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack  # Optional binary format for MsgpackStorage
+except ImportError:
+    msgpack = None
+
 
 class JSONStorage:
     """
@@ -38,7 +49,9 @@ class JSONStorage:
             return self._empty_data()
         
         try:
-            content = self.filepath.read_text(encoding="utf-8")
+            content = self.filepath.read_bytes()
+            if orjson is not None:
+                return orjson.loads(content)
             return json.loads(content)
         except json.JSONDecodeError as e:
             print(f"Warning: Invalid JSON in {self.filepath}: {e}")
@@ -47,23 +60,50 @@ class JSONStorage:
             print(f"Warning: Cannot read {self.filepath}: {e}")
             return self._empty_data()
     
-    def save(self, data: dict[str, Any]) -> None:
+    def save(self, data: dict[str, Any], pretty: bool = False) -> None:
         """
         Save data to JSON file.
         
         Args:
             data: Dictionary to save
+            pretty: Indent the output for human reading (default: compact)
         
         Raises:
             IOError: If file cannot be written
         """
         try:
-            content = json.dumps(data, indent=2, ensure_ascii=False)
-            self.filepath.write_text(content, encoding="utf-8")
+            if orjson is not None:
+                option = orjson.OPT_NON_STR_KEYS
+                if pretty:
+                    option |= orjson.OPT_INDENT_2
+                content = orjson.dumps(data, option=option)
+            elif pretty:
+                content = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+            else:
+                content = json.dumps(
+                    data, separators=(",", ":"), ensure_ascii=False
+                ).encode("utf-8")
+            self._atomic_write(content)
         except IOError as e:
             print(f"Error: Cannot write to {self.filepath}: {e}")
             raise
     
+    def _atomic_write(self, content: bytes) -> None:
+        """
+        Write content to a temp file, fsync it, then rename it over the
+        real file, so a crash never leaves a half-written JSON file.
+        """
+        tmp = self.filepath.with_name(self.filepath.name + ".tmp")
+        try:
+            with open(tmp, "wb") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.filepath)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+    
     def _empty_data(self) -> dict[str, Any]:
         """Return empty data structure."""
         return {"tasks": [], "next_id": 1}
@@ -76,3 +116,64 @@ class JSONStorage:
         """Delete storage file if it exists."""
         if self.filepath.exists():
             self.filepath.unlink()
+
+
+class MsgpackStorage(JSONStorage):
+    """
+    Binary msgpack persistence with the same interface as JSONStorage.
+    
+    Numbers and strings are length-prefixed instead of escaped text,
+    so files are smaller and faster to encode and decode.
+    Requires the optional msgpack package.
+    """
+    
+    def __init__(self, filepath: str = "tasks.mpk"):
+        """
+        Initialize storage with file path.
+        
+        Args:
+            filepath: Path to the msgpack file
+            
+        Raises:
+            ImportError: If msgpack is not installed
+        """
+        if msgpack is None:
+            raise ImportError("MsgpackStorage requires the msgpack package")
+        super().__init__(filepath)
+    
+    def load(self) -> dict[str, Any]:
+        """
+        Load data from msgpack file.
+        
+        Returns:
+            Dictionary with tasks and metadata.
+            Returns empty structure if file doesn't exist.
+        """
+        if not self.filepath.exists():
+            return self._empty_data()
+        
+        try:
+            return msgpack.unpackb(self.filepath.read_bytes())
+        except ValueError as e:
+            print(f"Warning: Invalid msgpack in {self.filepath}: {e}")
+            return self._empty_data()
+        except IOError as e:
+            print(f"Warning: Cannot read {self.filepath}: {e}")
+            return self._empty_data()
+    
+    def save(self, data: dict[str, Any], pretty: bool = False) -> None:
+        """
+        Save data to msgpack file.
+        
+        Args:
+            data: Dictionary to save
+            pretty: Ignored; msgpack is a binary format
+        
+        Raises:
+            IOError: If file cannot be written
+        """
+        try:
+            self._atomic_write(msgpack.packb(data, use_bin_type=True))
+        except IOError as e:
+            print(f"Error: Cannot write to {self.filepath}: {e}")
+            raise
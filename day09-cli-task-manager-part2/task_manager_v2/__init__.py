@@ -1,11 +1,11 @@
 """Task Manager v2 Package"""
 
 from .models import Task, TaskStatus, Priority
-from .manager import TaskManager, TaskNotFoundError, ValidationError
-from .storage import JSONStorage
+from .manager import TaskManager, TaskNotFoundError, ValidationError, configure_logging
+from .storage import JSONStorage, MsgpackStorage
 
 __all__ = [
     "Task", "TaskStatus", "Priority",
-    "TaskManager", "TaskNotFoundError", "ValidationError",
-    "JSONStorage",
+    "TaskManager", "TaskNotFoundError", "ValidationError", "configure_logging",
+    "JSONStorage", "MsgpackStorage",
 ]
@@ -14,7 +14,7 @@ import argparse
 import sys
 from typing import Optional
 
-from .manager import TaskManager, TaskNotFoundError, ValidationError
+from .manager import TaskManager, TaskNotFoundError, ValidationError, configure_logging
 from .models import TaskStatus, Priority
 
 
@@ -47,6 +47,19 @@ def info(msg: str) -> None:
 # Table Printer
 # ============================================================================
 
+# Pre-rendered table pieces for print_tasks (built once, not per row)
+_PRIORITY_CELLS = {
+    Priority.HIGH: f"{C.RED}!!!{C.RESET}",
+    Priority.MEDIUM: f"{C.YELLOW}!! {C.RESET}",
+    Priority.LOW: f"{C.GRAY}!  {C.RESET}",
+}
+_STATUS_CELLS = {
+    TaskStatus.COMPLETED: f"{C.GREEN}✓ Done   {C.RESET}",
+    TaskStatus.PENDING: f"{C.YELLOW}○ Pending{C.RESET}",
+}
+_ROW = ("{:>4}  {}  {}   {:<45}  " + C.GRAY + "{}" + C.RESET).format
+
+
 def print_tasks(tasks: list) -> None:
     """Print tasks in a formatted table with colors."""
     if not tasks:
@@ -57,24 +70,13 @@ def print_tasks(tasks: list) -> None:
     print(f"\n{C.BOLD}{'ID':>4}  {'Pri':<4}  {'Status':<12}  {'Title':<45}  {'Created':<12}{C.RESET}")
     print("─" * 85)
     
-    for t in tasks:
-        # Priority color
-        pri_colors = {"high": C.RED, "medium": C.YELLOW, "low": C.GRAY}
-        pri_display = {"high": "!!!", "medium": "!! ", "low": "!  "}
-        pri_c = pri_colors[t.priority.value]
-        pri_d = pri_display[t.priority.value]
-        
-        # Status
-        if t.status == TaskStatus.COMPLETED:
-            status_str = f"{C.GREEN}✓ Done   {C.RESET}"
-        else:
-            status_str = f"{C.YELLOW}○ Pending{C.RESET}"
-        
-        date = t.created_at[:10]
-        
-        print(f"{t.id:>4}  {pri_c}{pri_d}{C.RESET}  {status_str}   {t.title:<45}  {C.GRAY}{date}{C.RESET}")
-    
-    print()
+    rows = [
+        _ROW(t.id, _PRIORITY_CELLS[t.priority], _STATUS_CELLS[t.status],
+             t.title, t.created_at[:10])
+        for t in tasks
+    ]
+    # One write for the whole table, plus the trailing blank line
+    sys.stdout.write("\n".join(rows) + "\n\n")
 
 
 # ============================================================================
@@ -167,23 +169,23 @@ def cmd_add(manager: TaskManager, args) -> int:
 
 def cmd_list(manager: TaskManager, args) -> int:
     # Search overrides filters
+    status = priority = None
     if args.search:
-        tasks = manager.search(args.search)
         info(f"Search results for '{args.search}':")
     else:
-        # Apply filters
-        status = None
         if args.status != "all":
             status = TaskStatus(args.status)
-        
-        priority = None
         if args.priority:
             priority = Priority(args.priority)
-        
-        tasks = manager.list(status=status, priority=priority)
     
-    # Sort
-    tasks = manager.sorted_list(tasks, sort_by=args.sort, reverse=args.reverse)
+    # Filter/search and sort in one memoized call
+    tasks = manager.query(
+        status=status,
+        priority=priority,
+        search=args.search,
+        sort_by=args.sort,
+        reverse=args.reverse,
+    )
     
     # Summary
     stats = manager.stats()
@@ -194,12 +196,13 @@ def cmd_list(manager: TaskManager, args) -> int:
 
 
 def cmd_complete(manager: TaskManager, args) -> int:
+    done = {t.id: t for t in manager.complete_many(args.task_ids)}
     exit_code = 0
     for tid in args.task_ids:
-        try:
-            task = manager.complete(tid)
+        task = done.get(tid)
+        if task is not None:
             success(f"Completed #{tid}: {task.title}")
-        except TaskNotFoundError:
+        else:
             error(f"Task #{tid} not found. Use 'list' to see available tasks.")
             exit_code = 1
     return exit_code
@@ -235,6 +238,23 @@ def cmd_stats(manager: TaskManager) -> int:
 # Main Entry
 # ============================================================================
 
+# Command name (and alias) -> handler(manager, args), built once at import
+_DISPATCH = {
+    "add": cmd_add,
+    "list": cmd_list,
+    "ls": cmd_list,
+    "complete": cmd_complete,
+    "done": cmd_complete,
+    "delete": cmd_delete,
+    "rm": cmd_delete,
+    "stats": lambda manager, args: cmd_stats(manager),
+}
+
+
+# Commands that change tasks, and so are worth logging
+_MUTATING = frozenset({"add", "complete", "done", "delete", "rm"})
+
+
 def main() -> int:
     parser = create_parser()
     args = parser.parse_args()
@@ -243,29 +263,30 @@ def main() -> int:
         parser.print_help()
         return 0
     
+    if args.command in _MUTATING:
+        configure_logging()  # Read-only commands skip the log file entirely
     try:
         manager = TaskManager()
     except Exception as e:
         error(f"Failed to initialize: {e}")
         return 1
     
-    commands = {
-        "add": lambda: cmd_add(manager, args),
-        "list": lambda: cmd_list(manager, args),
-        "ls": lambda: cmd_list(manager, args),
-        "complete": lambda: cmd_complete(manager, args),
-        "done": lambda: cmd_complete(manager, args),
-        "delete": lambda: cmd_delete(manager, args),
-        "rm": lambda: cmd_delete(manager, args),
-        "stats": lambda: cmd_stats(manager),
-    }
-    
-    handler = commands.get(args.command)
-    if handler:
-        return handler()
+    handler = _DISPATCH.get(args.command)
+    if handler is None:
+        parser.print_help()
+        return 1
     
-    parser.print_help()
-    return 1
+    try:
+        with manager:  # One save after the command, not one per change
+            try:
+                exit_code = handler(manager, args)
+            except Exception as e:  # Storage is first read inside the handler
+                error(f"Failed to initialize: {e}")
+                return 1
+    except OSError as e:
+        error(f"Failed to save tasks: {e}")
+        return 1
+    return exit_code
 
 
 if __name__ == "__main__":
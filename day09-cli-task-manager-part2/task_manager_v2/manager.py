@@ -10,9 +10,12 @@ Changes from Day 8:
 """
 from __future__ import annotations
 
+import atexit
 import logging
 from datetime import datetime
-from typing import Optional
+from bisect import bisect_left, insort
+from operator import attrgetter, itemgetter
+from typing import Iterable, Optional
 
 from .models import Task, TaskStatus, Priority
 from .storage import JSONStorage
@@ -23,16 +26,40 @@ from .storage import JSONStorage
 # ============================================================================
 
 logger = logging.getLogger("task_manager")
-logger.setLevel(logging.DEBUG)
+logger.addHandler(logging.NullHandler())  # Silent until configure_logging()
 
-# File handler (detailed logs)
-file_handler = logging.FileHandler("task_manager.log", encoding="utf-8")
-file_handler.setLevel(logging.DEBUG)
-file_handler.setFormatter(logging.Formatter(
-    "%(asctime)s | %(levelname)-8s | %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S"
-))
-logger.addHandler(file_handler)
+
+def configure_logging(path: str = "task_manager.log") -> None:
+    """
+    Send detailed logs to a file, buffered in memory until exit.
+    
+    Called by the CLI once a real command runs, so importing this module
+    never opens the log file. Safe to call more than once.
+    """
+    import logging.handlers  # Pulls in socket/pickle/queue; only needed here
+    
+    if any(isinstance(h, logging.handlers.MemoryHandler) for h in logger.handlers):
+        return
+    logger.setLevel(logging.DEBUG)
+    
+    # File handler (detailed logs)
+    file_handler = logging.FileHandler(path, encoding="utf-8")
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(logging.Formatter(
+        "%(asctime)s | %(levelname)-8s | %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S"
+    ))
+    
+    # Buffer records and hand them to the file in one burst: at exit, when
+    # the buffer fills, or as soon as an ERROR arrives
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=1024,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True,
+    )
+    logger.addHandler(memory_handler)
+    atexit.register(memory_handler.flush)
 
 
 # ============================================================================
@@ -53,28 +80,129 @@ class ValidationError(Exception):
 # Task Manager
 # ============================================================================
 
+_task_id = attrgetter("id")
+
+# C-level key functions for sorted_list()
+_SORT_KEYS = {
+    "id": _task_id,
+    "title": attrgetter("_title_lc"),
+    "date": attrgetter("created_at"),
+    "status": attrgetter("status.value"),
+    "priority": attrgetter("_priority_weight"),
+}
+
+def _bucket_remove(bucket: list[Task], task: Task) -> None:
+    """Remove a task from an ID-ordered bucket by bisection."""
+    del bucket[bisect_left(bucket, task.id, key=_task_id)]
+
+
 class TaskManager:
     """
     Manages tasks with CRUD, filtering, sorting, search, and logging.
+    
+    Every change is saved right away. To save a burst of changes once,
+    use the manager as a context manager:
+    
+        with TaskManager() as manager:
+            manager.add("Write report")
+            manager.complete(1)
     """
     
     def __init__(self, storage: Optional[JSONStorage] = None):
         self.storage = storage or JSONStorage()
-        self.tasks: list[Task] = []
+        self._tasks: list[Task] = []
+        self._by_id: dict[int, Task] = {}  # Index for O(1) get()
+        # Pre-built buckets (each in ID order), so filters and stats skip the scan
+        self._by_status: dict[TaskStatus, list[Task]] = {s: [] for s in TaskStatus}
+        self._by_priority: dict[Priority, list[Task]] = {p: [] for p in Priority}
+        self._titles_lower: list[str] = []  # Each task's _title_lc, for search
         self._next_id: int = 1
-        self._load()
+        self._loaded = False  # Storage is read on first use, not here
+        # Stored records by ID until something needs every Task; None once
+        # materialized. A None value means the task lives in _by_id.
+        self._raw: Optional[dict[int, Optional[dict]]] = None
+        self._dirty = False  # Unsaved changes
+        self._autosave = True  # False inside a `with manager:` batch
+        # Bumped on every change; query() results are valid for one version
+        self._version: int = 0
+        self._query_cache: dict[tuple, list[Task]] = {}
+        self._cache_version: int = 0
+    
+    @property
+    def tasks(self) -> list[Task]:
+        """All tasks in ID order, loaded from storage on first access."""
+        self._materialize()
+        return self._tasks
     
     # ---- Persistence -------------------------------------------------------
     
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self._load()
+    
     def _load(self) -> None:
         data = self.storage.load()
-        self.tasks = [Task.from_dict(t) for t in data.get("tasks", [])]
+        # Keep the records as dicts; Tasks are built one at a time by get()
+        # or all at once by _materialize()
+        self._raw = {t["id"]: t for t in data.get("tasks", [])}
+        self._by_id = {}
         self._next_id = data.get("next_id", 1)
-        logger.info(f"Loaded {len(self.tasks)} tasks from storage")
+        self._loaded = True
+        logger.info("Loaded %d tasks from storage", len(self._raw))
+    
+    def _materialize(self) -> None:
+        """Build every Task plus the indexes that list/search/sort use."""
+        self._ensure_loaded()
+        if self._raw is None:
+            return
+        
+        by_id = self._by_id
+        self._tasks = [
+            by_id[i] if i in by_id else Task.from_dict(d)
+            for i, d in sorted(self._raw.items(), key=itemgetter(0))
+        ]  # Buckets rely on ID order
+        self._raw = None
+        self._by_status = {s: [] for s in TaskStatus}
+        self._by_priority = {p: [] for p in Priority}
+        for t in self._tasks:
+            self._by_status[t.status].append(t)
+            self._by_priority[t.priority].append(t)
+        self._by_id = {t.id: t for t in self._tasks}
+        self._titles_lower = [t._title_lc for t in self._tasks]
+    
+    def flush(self) -> None:
+        """Write tasks to storage if anything changed since the last write."""
+        if self._dirty:
+            self._save()
+            self._dirty = False
+    
+    def _autosave_flush(self) -> None:
+        """Save now, unless a batch defers it to the end of the block."""
+        if self._autosave:
+            self.flush()
+    
+    def __enter__(self) -> TaskManager:
+        """Start a batch: defer saves until the block ends."""
+        self._autosave = False
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """End the batch with a single save."""
+        self._autosave = True
+        self.flush()
     
     def _save(self) -> None:
+        if self._raw is not None:
+            # Untouched records are written back as they were loaded
+            by_id = self._by_id
+            tasks = [
+                by_id[i].to_dict() if i in by_id else d
+                for i, d in self._raw.items()
+            ]
+        else:
+            tasks = [t.to_dict() for t in self.tasks]
         data = {
-            "tasks": [t.to_dict() for t in self.tasks],
+            "tasks": tasks,
             "next_id": self._next_id
         }
         self.storage.save(data)
@@ -97,37 +225,117 @@ class TaskManager:
         """Add a new task with validation."""
         title = self._validate_title(title)
         pri = Priority(priority)
+        self._ensure_loaded()
+        
+        task = self._insert(Task(id=self._next_id, title=title, priority=pri))
+        logger.info("Added task #%d: '%s' [%s]", task.id, task.title, pri.value)
+        self._autosave_flush()
+        return task
+    
+    def add_many(self, titles: Iterable[str], priority: str = "medium") -> list[Task]:
+        """
+        Add several tasks sharing one creation timestamp.
         
-        task = Task(id=self._next_id, title=title, priority=pri)
+        Every title is validated before any task is created.
+        """
+        titles = [self._validate_title(t) for t in titles]
+        pri = Priority(priority)
+        self._ensure_loaded()
+        
+        created_at = datetime.now().isoformat()
+        added = [
+            self._insert(Task(id=self._next_id, title=title, priority=pri,
+                              created_at=created_at))
+            for title in titles
+        ]
+        if added:
+            logger.info("Added %d tasks [%s]", len(added), pri.value)
+        self._autosave_flush()
+        return added
+    
+    def _insert(self, task: Task) -> Task:
+        self._version += 1
+        self._dirty = True
         self._next_id += 1
-        self.tasks.append(task)
-        self._save()
-        logger.info(f"Added task #{task.id}: '{task.title}' [{pri.value}]")
+        self._by_id[task.id] = task
+        if self._raw is not None:
+            self._raw[task.id] = None
+            return task
+        self._tasks.append(task)
+        self._by_status[task.status].append(task)
+        self._by_priority[task.priority].append(task)
+        self._titles_lower.append(task._title_lc)
         return task
     
     def get(self, task_id: int) -> Task:
         """Get a task by ID."""
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        raise TaskNotFoundError(task_id)
+        self._ensure_loaded()
+        task = self._by_id.get(task_id)
+        if task is None:
+            data = self._raw.get(task_id) if self._raw is not None else None
+            if data is None:
+                raise TaskNotFoundError(task_id)
+            task = self._by_id[task_id] = Task.from_dict(data)
+        return task
     
     def complete(self, task_id: int) -> Task:
         """Mark a task as completed."""
         task = self.get(task_id)
-        task.complete()
-        self._save()
-        logger.info(f"Completed task #{task.id}: '{task.title}'")
+        self._mark_completed(task)
+        self._autosave_flush()
         return task
     
+    def complete_many(self, task_ids: Iterable[int]) -> list[Task]:
+        """
+        Mark several tasks as completed in one call.
+        
+        Unknown IDs are skipped; callers can spot them by comparing the
+        returned tasks' IDs against the ones they passed in.
+        """
+        completed = []
+        for tid in task_ids:
+            try:
+                task = self.get(tid)
+            except TaskNotFoundError:
+                continue
+            self._mark_completed(task)
+            completed.append(task)
+        self._autosave_flush()  # One save for the whole batch
+        return completed
+    
+    def _mark_completed(self, task: Task) -> None:
+        old_status = task.status
+        if not task.complete():
+            return  # Already completed; nothing to save
+        self._version += 1
+        self._dirty = True
+        if self._raw is None:
+            _bucket_remove(self._by_status[old_status], task)
+            insort(self._by_status[task.status], task, key=_task_id)
+        logger.info("Completed task #%d: '%s'", task.id, task.title)
+    
     def delete(self, task_id: int) -> Task:
         """Delete a task."""
         task = self.get(task_id)
-        self.tasks.remove(task)
-        self._save()
-        logger.warning(f"Deleted task #{task.id}: '{task.title}'")
+        del self._by_id[task_id]
+        if self._raw is not None:
+            del self._raw[task_id]
+        else:
+            self._remove_materialized(task)
+        self._version += 1
+        self._dirty = True
+        logger.warning("Deleted task #%d: '%s'", task.id, task.title)
+        self._autosave_flush()
         return task
     
+    def _remove_materialized(self, task: Task) -> None:
+        # Bisect the ID-ordered list; deleting in place keeps that order
+        i = bisect_left(self._tasks, task.id, key=_task_id)
+        del self._tasks[i]
+        del self._titles_lower[i]
+        _bucket_remove(self._by_status[task.status], task)
+        _bucket_remove(self._by_priority[task.priority], task)
+    
     # ---- Filtering ---------------------------------------------------------
     
     def list(
@@ -136,14 +344,20 @@ class TaskManager:
         priority: Optional[Priority] = None,
     ) -> list[Task]:
         """List tasks with optional filtering."""
-        tasks = self.tasks
-        
-        if status is not None:
-            tasks = [t for t in tasks if t.status == status]
-        if priority is not None:
-            tasks = [t for t in tasks if t.priority == priority]
+        self._materialize()
+        if status is None and priority is None:
+            return self.tasks
+        if priority is None:
+            return self._by_status[status].copy()
+        if status is None:
+            return self._by_priority[priority].copy()
         
-        return tasks
+        # Both filters: scan the smaller bucket for the other field
+        by_status = self._by_status[status]
+        by_priority = self._by_priority[priority]
+        if len(by_status) <= len(by_priority):
+            return [t for t in by_status if t.priority is priority]
+        return [t for t in by_priority if t.status is status]
     
     # ---- Sorting -----------------------------------------------------------
     
@@ -153,40 +367,105 @@ class TaskManager:
         sort_by: str = "id",
         reverse: bool = False,
     ) -> list[Task]:
-        """Sort tasks by a field."""
-        if tasks is None:
-            tasks = self.tasks
+        """
+        Sort tasks by a field.
         
-        sort_keys = {
-            "id": lambda t: t.id,
-            "title": lambda t: t.title.lower(),
-            "date": lambda t: t.created_at,
-            "status": lambda t: t.status.value,
-            "priority": lambda t: t.priority.weight,
-        }
+        Pass the already-filtered list so only the matches are sorted;
+        with no list, all tasks are sorted. Unknown fields sort by ID.
+        """
+        if tasks is None:
+            tasks = self.list()
+        if len(tasks) < 2:
+            return list(tasks)  # Nothing to order
         
-        key_func = sort_keys.get(sort_by, sort_keys["id"])
-        return sorted(tasks, key=key_func, reverse=reverse)
+        return sorted(tasks, key=_SORT_KEYS.get(sort_by, _task_id), reverse=reverse)
     
     # ---- Search ------------------------------------------------------------
     
     def search(self, query: str) -> list[Task]:
         """Search tasks by title (case-insensitive)."""
+        self._materialize()
         query = query.lower()
-        results = [t for t in self.tasks if query in t.title.lower()]
-        logger.debug(f"Search '{query}' returned {len(results)} results")
+        results = [
+            t for t, title in zip(self._tasks, self._titles_lower) if query in title
+        ]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Search '%s' returned %d results", query, len(results))
         return results
     
+    # ---- Queries -----------------------------------------------------------
+    
+    def query(
+        self,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[Priority] = None,
+        search: Optional[str] = None,
+        sort_by: str = "id",
+        reverse: bool = False,
+    ) -> list[Task]:
+        """
+        Filter (or search) then sort, memoized until the tasks change.
+        
+        A search overrides the status/priority filters.
+        """
+        self._ensure_loaded()
+        if self._cache_version != self._version:
+            self._query_cache.clear()
+            self._cache_version = self._version
+        
+        key = (status, priority, search, sort_by, reverse)
+        result = self._query_cache.get(key)
+        if result is None:
+            tasks = self.search(search) if search else self.list(status, priority)
+            if sort_by == "id" or sort_by not in _SORT_KEYS:
+                # list() and search() already return ID order
+                result = tasks[::-1] if reverse else list(tasks)
+            else:
+                result = self.sorted_list(tasks, sort_by, reverse)
+            self._query_cache[key] = result
+        return list(result)
+    
     # ---- Stats -------------------------------------------------------------
     
     def count(self, status: Optional[TaskStatus] = None) -> int:
-        return len(self.list(status))
+        if status is None:
+            return len(self.tasks)
+        self._materialize()
+        return len(self._by_status[status])
     
     def stats(self) -> dict:
-        """Get task statistics."""
+        """Get task statistics from the bucket sizes."""
+        self._ensure_loaded()
+        if self._raw is not None:
+            return self._raw_stats()
+        return {
+            "total": len(self._tasks),
+            "pending": len(self._by_status[TaskStatus.PENDING]),
+            "completed": len(self._by_status[TaskStatus.COMPLETED]),
+            "high_priority": len(self._by_priority[Priority.HIGH]),
+        }
+    
+    def _raw_stats(self) -> dict:
+        """Count straight from the stored records, without building Tasks."""
+        pending = completed = high = 0
+        PENDING, HIGH = TaskStatus.PENDING, Priority.HIGH
+        by_id = self._by_id
+        for i, d in self._raw.items():
+            if i in by_id:  # Built (and maybe changed) since loading
+                t = by_id[i]
+                is_pending, is_high = t.status is PENDING, t.priority is HIGH
+            else:
+                is_pending = d["status"] == "pending"
+                is_high = d.get("priority", "medium") == "high"
+            if is_pending:
+                pending += 1
+            else:
+                completed += 1
+            if is_high:
+                high += 1
         return {
-            "total": len(self.tasks),
-            "pending": self.count(TaskStatus.PENDING),
-            "completed": self.count(TaskStatus.COMPLETED),
-            "high_priority": len([t for t in self.tasks if t.priority == Priority.HIGH]),
+            "total": len(self._raw),
+            "pending": pending,
+            "completed": completed,
+            "high_priority": high,
         }
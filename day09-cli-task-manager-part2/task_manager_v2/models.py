@@ -8,6 +8,7 @@ Changes from Day 8:
 """
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -27,10 +28,35 @@ class Priority(Enum):
     @property
     def weight(self) -> int:
         """Numeric weight for sorting (higher = more urgent)."""
-        return {"low": 1, "medium": 2, "high": 3}[self.value]
+        return self._weight
 
 
-@dataclass
+# Stored on each member once, so weight is a plain attribute read
+for _priority, _weight in ((Priority.LOW, 1), (Priority.MEDIUM, 2), (Priority.HIGH, 3)):
+    _priority._weight = _weight
+del _priority, _weight
+
+_STATUS_BY_VALUE = TaskStatus._value2member_map_
+_PRIORITY_BY_VALUE = Priority._value2member_map_
+
+
+def _task_status(value) -> TaskStatus:
+    """Look up a stored status directly, skipping Enum.__call__ for valid data."""
+    try:
+        return _STATUS_BY_VALUE[value]
+    except (KeyError, TypeError):
+        return TaskStatus(value)  # Raises ValueError
+
+
+def _task_priority(value) -> Priority:
+    """Look up a stored priority directly, skipping Enum.__call__ for valid data."""
+    try:
+        return _PRIORITY_BY_VALUE[value]
+    except (KeyError, TypeError):
+        return Priority(value)  # Raises ValueError
+
+
+@dataclass(slots=True)
 class Task:
     """
     A task with id, title, status, priority, and timestamps.
@@ -47,13 +73,21 @@ class Task:
         default_factory=lambda: datetime.now().isoformat()
     )
     completed_at: Optional[str] = None
+    # Derived sort/search keys, computed once per task
+    _title_lc: str = field(init=False, repr=False, compare=False)
+    _priority_weight: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self._title_lc = self.title.lower()
+        self._priority_weight = self.priority.weight
     
-    def complete(self) -> None:
-        """Mark as completed."""
-        if self.status == TaskStatus.COMPLETED:
-            return
+    def complete(self) -> bool:
+        """Mark as completed; returns False if it already was."""
+        if self.status is TaskStatus.COMPLETED:
+            return False
         self.status = TaskStatus.COMPLETED
         self.completed_at = datetime.now().isoformat()
+        return True
     
     def to_dict(self) -> dict:
         return {
@@ -70,13 +104,14 @@ class Task:
         return cls(
             id=data["id"],
             title=data["title"],
-            status=TaskStatus(data["status"]),
-            priority=Priority(data.get("priority", "medium")),
-            created_at=data["created_at"],
+            status=_task_status(data["status"]),
+            priority=_task_priority(data.get("priority", "medium")),
+            # Interned so tasks created in one batch share a single string
+            created_at=sys.intern(data["created_at"]),
             completed_at=data.get("completed_at")
         )
     
     def __str__(self) -> str:
-        icon = "✓" if self.status == TaskStatus.COMPLETED else "○"
+        icon = "✓" if self.status is TaskStatus.COMPLETED else "○"
         pri = {"high": "!!!", "medium": "!!", "low": "!"}[self.priority.value]
         return f"[{icon}] #{self.id} ({pri}) {self.title}"
@@ -4,9 +4,20 @@ JSON Storage Layer (v2) — Same as Day 8
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson  # Optional C-accelerated JSON encoder/decoder
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack  # Optional binary format for MsgpackStorage
+except ImportError:
+    msgpack = None
+
 
 class JSONStorage:
     """Handles JSON file persistence."""
@@ -18,16 +29,61 @@ class JSONStorage:
         if not self.filepath.exists():
             return {"tasks": [], "next_id": 1}
         try:
-            return json.loads(self.filepath.read_text(encoding="utf-8"))
+            raw = self.filepath.read_bytes()
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
         except json.JSONDecodeError as e:
             print(f"Warning: Invalid JSON in {self.filepath}: {e}")
             return {"tasks": [], "next_id": 1}
     
-    def save(self, data: dict[str, Any]) -> None:
-        self.filepath.write_text(
-            json.dumps(data, indent=2, ensure_ascii=False),
-            encoding="utf-8"
-        )
+    def save(self, data: dict[str, Any], pretty: bool = False) -> None:
+        """Write data as compact JSON, or indented if pretty is set."""
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            content = orjson.dumps(data, option=option)
+        elif pretty:
+            content = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        else:
+            content = json.dumps(
+                data, separators=(",", ":"), ensure_ascii=False
+            ).encode("utf-8")
+        self._atomic_write(content)
+    
+    def _atomic_write(self, content: bytes) -> None:
+        """Write via temp file + fsync + rename so the file is never half-written."""
+        tmp = self.filepath.with_name(self.filepath.name + ".tmp")
+        try:
+            with open(tmp, "wb") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.filepath)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
     
     def exists(self) -> bool:
         return self.filepath.exists()
+
+
+class MsgpackStorage(JSONStorage):
+    """Binary msgpack persistence; needs the optional msgpack package."""
+    
+    def __init__(self, filepath: str = "tasks.mpk"):
+        if msgpack is None:
+            raise ImportError("MsgpackStorage requires the msgpack package")
+        super().__init__(filepath)
+    
+    def load(self) -> dict[str, Any]:
+        if not self.filepath.exists():
+            return {"tasks": [], "next_id": 1}
+        try:
+            return msgpack.unpackb(self.filepath.read_bytes())
+        except ValueError as e:
+            print(f"Warning: Invalid msgpack in {self.filepath}: {e}")
+            return {"tasks": [], "next_id": 1}
+    
+    def save(self, data: dict[str, Any], pretty: bool = False) -> None:
+        """Write data as msgpack; pretty is ignored for the binary format."""
+        self._atomic_write(msgpack.packb(data, use_bin_type=True))